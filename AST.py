@@ -27,9 +27,7 @@ class NodeType(Enum):
     FunctionParameter = "FunctionParameter"
 
 class Node(ABC):
-    @abstractmethod
-    def type(self) -> NodeType:
-        pass
+    type: NodeType
 
     @abstractmethod
     def json(self) -> dict:
@@ -43,30 +41,28 @@ class Expression(Node):
     pass
 
 class Program(Node):
+    type: NodeType = NodeType.Program
+
     def __init__(self) -> None:
         self.statements: list[Statement] = []
 
-    def type(self) -> NodeType:
-        return NodeType.Program
-
     def json(self) -> dict:
         return {
-            "type": self.type().value,
-            "statements": [{stmt.type().value: stmt.json()} for stmt in self.statements]
+            "type": self.type.value,
+            "statements": [{stmt.type.value: stmt.json()} for stmt in self.statements]
         }
 
 # region Helpers
 class FunctionParameter(Expression):
+    type: NodeType = NodeType.FunctionParameter
+
     def __init__(self, name: str, value_type: str = None) -> None:
         self.name = name
         self.value_type = value_type
     
-    def type(self) -> NodeType:
-        return NodeType.FunctionParameter
-
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "name": self.name,
             "value_type": self.value_type
         }
@@ -75,73 +71,68 @@ class FunctionParameter(Expression):
 
 # region Statements
 class ExpressionStatement(Statement):
+    type: NodeType = NodeType.ExpressionStatement
+
     def __init__(self, expr: Expression = None) -> None:
         self.expr: Expression = expr
 
-    def type(self) -> NodeType:
-        return NodeType.ExpressionStatement
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "expr": self.expr.json()
         }
 
 class LetStatement(Statement):
+    type: NodeType = NodeType.LetStatement
+
     def __init__(self, name: Expression = None, value: Expression = None, value_type: str = None) -> None:
         self.name: Expression = name
         self.value: Expression = value
 
-    def type(self) -> NodeType:
-        return NodeType.LetStatement
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "expr": self.name.json(),
             "value": self.value.json(),
             "value_type": self.value_type
         }
 
 class BlockStatement(Statement):
+    type: NodeType = NodeType.BlockStatement
+
     def __init__(self, statements: list[Statement] = None) -> None:
         self.statements = statements if statements is not None else []
 
-    def type(self) -> NodeType:
-        return NodeType.BlockStatement
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "statements": [stmt.json() for stmt in self.statements]
         }
 
 class ReturnStatement(Statement):
+    type: NodeType = NodeType.ReturnStatement
+
     def __init__(self, return_value: Expression = None) -> None:
         self.return_value = return_value
 
-    def type(self) -> NodeType:
-        return NodeType.ReturnStatement
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "return_value": self.return_value.json(),
         }
 
 class FunctionStatement(Statement):
+    type: NodeType = NodeType.FunctionStatement
+
     def __init__(self, parameters: list[FunctionParameter] = [], body: BlockStatement = None, name = None, return_type: str = None) -> None:
         self.parameters = parameters
         self.body = body
         self.name = name
         self.return_type = return_type
 
-    def type(self) -> NodeType:
-        return NodeType.FunctionStatement
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "name": self.name.json(),
             "return_type": self.return_type,
             "parameters": [p.json() for p in self.parameters],
@@ -149,68 +140,64 @@ class FunctionStatement(Statement):
         }
 
 class AssignStatement(Statement):
+    type: NodeType = NodeType.AssignStatement
+
     def __init__(self, ident: Expression = None, right_value: Expression = None) -> None:
         self.ident = ident
         self.right_value = right_value
 
-    def type(self) -> NodeType:
-        return NodeType.AssignStatement
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "ident": self.ident.json(),
             "right_value": self.right_value.json()
         }
 
 class IfStatement(Statement):
+    type: NodeType = NodeType.IfStatement
+
     def __init__(self, condition: Expression = None, consequence: BlockStatement = None, alternative: BlockStatement = None) -> None:
         self.condition = condition
         self.consequence = consequence
         self.alternative = alternative
 
-    def type(self) -> NodeType:
-        return NodeType.IfStatement
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "condition": self.condition.json(),
             "consequence": self.consequence.json(),
-            "alternative": self.alternative.json(),
+            "alternative": self.alternative.json() if self.alternative is not None else None,
         }
 
 # endregion
 
 # region Expressions
 class InfixExpression(Expression):
+    type: NodeType = NodeType.InfixExpression
+
     def __init__(self, left_node: Expression, operator: str, right_node: Expression = None) -> None:
        self.left_node: Expression = left_node
        self.operator: str = operator
        self.right_node: Expression = right_node
     
-    def type(self) -> NodeType:
-        return NodeType.InfixExpression
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "left_node": self.left_node.json(),
             "operator": self.operator,
             "right_node": self.right_node.json()  
         }
 
 class CallExpression(Expression):
+    type: NodeType = NodeType.CallExpression
+
     def __init__(self, function: Expression = None, arguments: list[Expression] = None) -> None:
        self.function = function
        self.arguments = arguments
     
-    def type(self) -> NodeType:
-        return NodeType.CallExpression
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "function": self.function.json(),
             "arguments": [arg.json() for arg in self.arguments]
         }
@@ -218,54 +205,50 @@ class CallExpression(Expression):
 
 # region Literals
 class IntegerLiteral(Expression):
+    type: NodeType = NodeType.IntegerLiteral
+
     def __init__(self, value: int = None) -> None:
        self.value: int = value
     
-    def type(self) -> NodeType:
-        return NodeType.IntegerLiteral
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "value": self.value
         }
 
 class FloatLiteral(Expression):
+    type: NodeType = NodeType.FloatLiteral
+
     def __init__(self, value: float = None) -> None:
        self.value: int = value
     
-    def type(self) -> NodeType:
-        return NodeType.FloatLiteral
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "value": self.value  
         }
 
 class IdentifierLiteral(Expression):
+    type: NodeType = NodeType.IdentifierLiteral
+
     def __init__(self, value: str = None) -> None:
        self.value: str = value
     
-    def type(self) -> NodeType:
-        return NodeType.IdentifierLiteral
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "value": self.value
         }
 
 class BooleanLiteral(Expression):
+    type: NodeType = NodeType.BooleanLiteral
+
     def __init__(self, value: bool = None) -> None:
        self.value: bool = value
     
-    def type(self) -> NodeType:
-        return NodeType.BooleanLiteral
-    
     def json(self) -> dict:
         return {
-            "type": self.type().value,
+            "type": self.type.value,
             "value": self.value
         }
 # endregion
\ No newline at end of file
@@ -1,4 +1,7 @@
 from llvmlite import ir
+import llvmlite.binding as llvm
+
+import json
 
 from AST import Node, NodeType, Program, Expression, Statement
 from AST import ExpressionStatement, LetStatement, BlockStatement, FunctionStatement, ReturnStatement, AssignStatement, IfStatement
@@ -8,26 +11,126 @@ from AST import FunctionParameter
 
 from Environment import Environment
 
+from typing import Callable
+
 class Compiler:
+    # Operator -> IRBuilder method tables, built once at class scope so each
+    # infix visit is a dict lookup instead of a chain of string comparisons.
+    # Comparison operators share one builder method (icmp_signed/fcmp_ordered)
+    # because the operator string is already the LLVM predicate.
+    _INT_BINOPS: dict[str, str] = {
+        '+': 'add',
+        '-': 'sub',
+        '*': 'mul',
+        '/': 'sdiv',
+        '%': 'srem'
+    }
+
+    _FLOAT_BINOPS: dict[str, str] = {
+        '+': 'fadd',
+        '-': 'fsub',
+        '*': 'fmul',
+        '/': 'fdiv',
+        '%': 'frem'
+    }
+
+    _COMPARISONS: frozenset[str] = frozenset(('<', '<=', '>', '>=', '==', '!='))
+
+    # Small integer type codes carried alongside every resolved (value, type)
+    # pair, so infix dispatch indexes a table instead of isinstance-checking
+    # the operand types. Booleans are IntTypes and share the integer tables.
+    INT_CODE: int = 0
+    FLOAT_CODE: int = 1
+    BOOL_CODE: int = 2
+
+    _BINOP_TABLES: tuple[dict[str, str], ...] = (_INT_BINOPS, _FLOAT_BINOPS, _INT_BINOPS)
+    _CMP_METHODS: tuple[str, ...] = ('icmp_signed', 'fcmp_ordered', 'icmp_signed')
+
+    _CONST_LITERALS: frozenset[NodeType] = frozenset((NodeType.IntegerLiteral, NodeType.FloatLiteral))
+
     def __init__(self) -> None:
+        # Frequently used types, cached once so the hot paths skip the
+        # type_map probe and the IntType construction
+        self.int_t: ir.Type = ir.IntType(32)
+        self.float_t: ir.Type = ir.FloatType()
+        self.bool_t: ir.Type = ir.IntType(1)
+
         self.type_map: dict[str, ir.Type] = {
-            'int': ir.IntType(32),
-            'float': ir.FloatType(),
-            'bool': ir.IntType(1)
+            'int': self.int_t,
+            'float': self.float_t,
+            'bool': self.bool_t
+        }
+
+        self._type_codes: dict[ir.Type, int] = {
+            self.int_t: self.INT_CODE,
+            self.float_t: self.FLOAT_CODE,
+            self.bool_t: self.BOOL_CODE
         }
 
+        # Constants are immutable, so repeated literals share one ir.Constant
+        # instead of allocating a fresh object per AST visit
+        self._int_const_cache: dict[int, ir.Constant] = {}
+        self._float_const_cache: dict[float, ir.Constant] = {}
+
+        # Names that are ever reassigned; filled in by the pre-pass in
+        # __visit_program so single-assignment lets can skip their stack slot
+        self._mutated_names: set[str] = set()
+
+        # Structural-hash memo of emitted functions, so duplicated bodies
+        # lower to IR once and later copies just alias the first function
+        self._function_ir_cache: dict[str, tuple[ir.Function, ir.Type]] = {}
+
         self.module: ir.Module = ir.Module('main')
         self.builder: ir.IRBuilder = ir.IRBuilder()
         self.env : Environment = Environment()
 
         self.errors: list[str] = []
 
+        # Filled in by finalize(); the binding module and its IR text are
+        # produced exactly once per compile and reused by every consumer
+        self.llvm_module: llvm.ModuleRef | None = None
+        self._ir_text: str | None = None
+
+        # Dispatch tables built once so each visit is a single dict lookup
+        # instead of a chain of NodeType comparisons
+        self._dispatch: dict[NodeType, Callable] = {
+            NodeType.Program: self.__visit_program,
+
+            # Statements
+            NodeType.ExpressionStatement: self.__visit_expression_statement,
+            NodeType.LetStatement: self.__visit_let_statement,
+            NodeType.FunctionStatement: self.__visit_function_statement,
+            NodeType.BlockStatement: self.__visit_block_statement,
+            NodeType.ReturnStatement: self.__visit_return_statement,
+            NodeType.AssignStatement: self.__visit_assign_statement,
+            NodeType.IfStatement: self.__visit_if_statement,
+
+            # Expressions
+            NodeType.InfixExpression: self.__visit_infix_expression,
+            NodeType.CallExpression: self.__visit_call_expression
+        }
+
+        self._resolve_dispatch: dict[NodeType, Callable] = {
+            NodeType.IntegerLiteral: self.__resolve_integer_literal,
+            NodeType.FloatLiteral: self.__resolve_float_literal,
+            NodeType.IdentifierLiteral: self.__resolve_identifier_literal,
+            NodeType.BooleanLiteral: self.__resolve_boolean_literal,
+
+            # Expression Values
+            NodeType.InfixExpression: self.__visit_infix_expression,
+            NodeType.CallExpression: self.__visit_call_expression
+        }
+
+        # compile is generated per instance as a straight-line if/elif chain
+        # over the dispatch table, ordered hottest-first
+        self.compile: Callable[[Node], None] = self.__build_compile()
+
         self.__initialize_builtins()
 
 
     def __initialize_builtins(self) -> None:
         def __init_booleans() -> tuple[ir.GlobalVariable, ir.GlobalVariable]:
-            bool_type: ir.Type = self.type_map['bool']
+            bool_type: ir.Type = self.bool_t
 
             true_var = ir.GlobalVariable(self.module, bool_type, 'true')
             true_var.initializer = ir.Constant(bool_type, 1)
@@ -43,37 +146,87 @@ class Compiler:
         self.env.define('true', true_var, true_var.type)
         self.env.define('false', false_var, false_var.type)
 
-    def compile(self, node: Node) -> None:
-        match node.type():
-            case NodeType.Program:
-                self.__visit_program(node)
+    def __build_compile(self) -> Callable[[Node], None]:
+        """ Generates a specialized compile() whose body is an if/elif chain
+            ordered by how often each node kind occurs, with the visitor
+            bindings baked in as locals -- dispatch costs one identity check
+            for the common cases instead of a dict probe """
+        order = [
+            NodeType.ExpressionStatement,
+            NodeType.InfixExpression,
+            NodeType.LetStatement,
+            NodeType.CallExpression,
+            NodeType.AssignStatement,
+            NodeType.ReturnStatement,
+            NodeType.IfStatement,
+            NodeType.BlockStatement,
+            NodeType.FunctionStatement,
+            NodeType.Program
+        ]
+
+        lines = ['def _compile(node):']
+        branch = 'if'
+        for i, node_type in enumerate(order):
+            lines.append(f'    {branch} node.type is _t{i}:')
+            lines.append(f'        _f{i}(node)')
+            branch = 'elif'
+        source = '\n'.join(lines)
+
+        namespace = {f'_t{i}': t for i, t in enumerate(order)}
+        namespace.update({f'_f{i}': self._dispatch[t] for i, t in enumerate(order)})
+        exec(compile(source, '<compile-dispatch>', 'exec'), namespace)
+
+        return namespace['_compile']
 
-            # Statements
-            case NodeType.ExpressionStatement:
-                self.__visit_expression_statement(node)
-            case NodeType.LetStatement:
-                self.__visit_let_statement(node)
-            case NodeType.FunctionStatement:
-                self.__visit_function_statement(node)
-            case NodeType.BlockStatement:
-                self.__visit_block_statement(node)
-            case NodeType.ReturnStatement:
-                self.__visit_return_statement(node)
-            case NodeType.AssignStatement:
-                self.__visit_assign_statement(node)
-            case NodeType.IfStatement:
-                self.__visit_if_statement(node)
-
-            case NodeType.InfixExpression:
-                self.__visit_infix_expression(node)
-            case NodeType.CallExpression:
-                self.__visit_call_expression(node)
-            
     # region Visit Methods
     def __visit_program(self, node: Program) -> None:
+        self._mutated_names = self.__collect_mutated_names(node.statements)
         for stmt in node.statements:
             self.compile(stmt)
 
+    def __collect_mutated_names(self, statements: list[Statement]) -> set[str]:
+        """ Collects every name that is reassigned or re-declared anywhere in
+            the program. Lets whose name never shows up here are
+            single-assignment and bind their SSA value directly """
+        mutated: set[str] = set()
+        let_seen: set[str] = set()
+
+        def walk_expr(expr: Expression) -> None:
+            # if parses as a prefix expression, so if statements reach the
+            # walk wrapped in expression positions
+            if expr is not None and expr.type is NodeType.IfStatement:
+                walk(expr.consequence.statements)
+                if expr.alternative is not None:
+                    walk(expr.alternative.statements)
+
+        def walk(stmts: list[Statement]) -> None:
+            for stmt in stmts:
+                t = stmt.type
+                if t is NodeType.AssignStatement:
+                    mutated.add(stmt.ident.value)
+                    walk_expr(stmt.right_value)
+                elif t is NodeType.LetStatement:
+                    name = stmt.name.value
+                    if name in let_seen:
+                        mutated.add(name)
+                    let_seen.add(name)
+                    walk_expr(stmt.value)
+                elif t is NodeType.ExpressionStatement:
+                    walk_expr(stmt.expr)
+                elif t is NodeType.ReturnStatement:
+                    walk_expr(stmt.return_value)
+                elif t is NodeType.BlockStatement:
+                    walk(stmt.statements)
+                elif t is NodeType.IfStatement:
+                    walk(stmt.consequence.statements)
+                    if stmt.alternative is not None:
+                        walk(stmt.alternative.statements)
+                elif t is NodeType.FunctionStatement:
+                    walk(stmt.body.statements)
+
+        walk(statements)
+        return mutated
+
 
     # region Statements
     def __visit_expression_statement(self, node: ExpressionStatement) -> None:
@@ -84,28 +237,82 @@ class Compiler:
         value: Expression = node.value
         value_type: str = node.value_type
 
-        value, Type = self.__resolve_value(node=value)
-        
-        if self.env.lookup(name) is None:
-            # Define and allocate the value
-            ptr = self.builder.alloca(Type)
+        value, Type, _ = self.__resolve_value(node=value)
 
-            # Storing the value to the ptr
-            self.builder.store(value, ptr)
+        b = self.builder
+        env = self.env
+        entry = env.lookup(name)
+        if entry is None:
+            if name not in self._mutated_names:
+                # Never reassigned: bind the SSA value directly, no stack slot
+                env.define(name, value, Type, is_ssa=True)
+            else:
+                # Define and allocate the value
+                ptr = b.alloca(Type)
 
-            # Add the variable to the environment
-            self.env.define(name, ptr, Type)
+                # Storing the value to the ptr
+                b.store(value, ptr)
+
+                # Add the variable to the environment
+                env.define(name, ptr, Type)
         else:
-            ptr, _ = self.env.lookup(name)
-            self.builder.store(value, ptr)
+            ptr, _, _ = entry
+            b.store(value, ptr)
     
     def __visit_block_statement(self, node: BlockStatement) -> None:
+        # Runs of lets with literal values emit no IR while resolving, so
+        # their stores are collected and appended to the block in one sweep
+        deferred: list[tuple[ir.Value, ir.Value]] = []
         for stmt in node.statements:
+            if stmt.type is NodeType.LetStatement and stmt.value.type in self._CONST_LITERALS:
+                self.__visit_constant_let(stmt, deferred)
+                continue
+
+            if deferred:
+                self.__emit_stores(deferred)
+                deferred = []
+
             self.compile(stmt)
+
+        if deferred:
+            self.__emit_stores(deferred)
+
+    def __visit_constant_let(self, node: LetStatement, deferred: list[tuple[ir.Value, ir.Value]]) -> None:
+        """ Let bound to a literal: same bookkeeping as a normal let, but the
+            store (if one is needed) is deferred for batched emission """
+        name: str = node.name.value
+
+        value, Type, _ = self.__resolve_value(node.value)
+
+        env = self.env
+        entry = env.lookup(name)
+        if entry is None:
+            if name not in self._mutated_names:
+                env.define(name, value, Type, is_ssa=True)
+            else:
+                ptr = self.builder.alloca(Type)
+                env.define(name, ptr, Type)
+                deferred.append((value, ptr))
+        else:
+            deferred.append((value, entry[0]))
+
+    def __emit_stores(self, pairs: list[tuple[ir.Value, ir.Value]]) -> None:
+        """ Appends store instructions for (value, ptr) pairs directly to the
+            current block, skipping IRBuilder.store's per-call wrapper work """
+        b = self.builder
+        block = b.block
+        append = block.instructions.append
+        for value, ptr in pairs:
+            st = ir.StoreInstr(block, value, ptr)
+            st.align = None
+            append(st)
+
+        # Realign the builder's insertion point past the appended stores
+        b.position_at_end(block)
     
     def __visit_return_statement(self, node: ReturnStatement) -> None:
         value: Expression = node.return_value
-        value, Type = self.__resolve_value(value)
+        value, Type, _ = self.__resolve_value(value)
 
         self.builder.ret(value)
     
@@ -114,6 +321,18 @@ class Compiler:
         body: BlockStatement = node.body
         params: list[FunctionParameter] = node.parameters
 
+        # A function structurally identical to one already lowered (same
+        # signature and body) compiles to the same IR; alias it instead
+        key: str = json.dumps({
+            'parameters': [p.json() for p in params],
+            'return_type': node.return_type,
+            'body': body.json()
+        })
+        cached = self._function_ir_cache.get(key)
+        if cached is not None:
+            self.env.define(name, cached[0], cached[1])
+            return
+
         param_names: list[str] = [p.name for p in params]
 
         # Keep track of the types for each parameter
@@ -131,15 +350,20 @@ class Compiler:
         self.builder = ir.IRBuilder(block)
 
         # Storing the pointers to each parameter
+        b = self.builder
         params_ptr = []
         for i, typ in enumerate(param_types):
-            ptr = self.builder.alloca(typ)
-            self.builder.store(func.args[i], ptr)
+            ptr = b.alloca(typ)
+            b.store(func.args[i], ptr)
             params_ptr.append(ptr)
 
         # Adding the parameters to the environment
         previous_env = self.env
 
+        # Define the function in the enclosing scope before descending, so
+        # the body environment inherits it and recursive calls resolve
+        previous_env.define(name, func, return_type)
+
         self.env = Environment(parent=previous_env)
         for i, x in enumerate(zip(param_types, param_names)):
             typ = param_types[i]
@@ -147,25 +371,25 @@ class Compiler:
 
             self.env.define(x[1], ptr, typ)
 
-        self.env.define(name, func, return_type)
-
         self.compile(body)
 
         self.env = previous_env
-        self.env.define(name, func, return_type)
 
         self.builder = previous_builder
 
+        self._function_ir_cache[key] = (func, return_type)
+
     def __visit_assign_statement(self, node: AssignStatement) -> None:
         name: str = node.ident.value
         value: Expression = node.right_value
 
-        value, Type = self.__resolve_value(value)
-        
-        if self.env.lookup(name) is None:
+        value, Type, _ = self.__resolve_value(value)
+
+        entry = self.env.lookup(name)
+        if entry is None:
             self.errors.append(f"COMPILE ERROR: Identifier {name} has not been declared before it was re-assigned")
         else:
-            ptr, _ = self.env.lookup(name)
+            ptr, _, _ = entry
             self.builder.store(value, ptr)
     
     def __visit_if_statement(self, node: IfStatement) -> None:
@@ -173,7 +397,7 @@ class Compiler:
         consequence = node.consequence
         alternative = node.alternative
 
-        test, _ = self.__resolve_value(condition)
+        test, _, _ = self.__resolve_value(condition)
 
         if alternative is None:
             with self.builder.if_then(test):
@@ -188,85 +412,28 @@ class Compiler:
     # endregion
 
     # region Expressions
-    def __visit_infix_expression(self, node: InfixExpression) -> None:
+    def __visit_infix_expression(self, node: InfixExpression) -> tuple[ir.Value, ir.Type, int]:
         operator: str = node.operator
-        left_value, left_type = self.__resolve_value(node.left_node)
-        right_value, right_type = self.__resolve_value(node.right_node)
+        left_value, left_type, left_code = self.__resolve_value(node.left_node)
+        right_value, right_type, right_code = self.__resolve_value(node.right_node)
 
         value = None
         Type = None
-        if isinstance(right_type, ir.IntType) and isinstance(left_type, ir.IntType):
-            Type = self.type_map['int']
-            match operator:
-                case '+':
-                    value = self.builder.add(left_value, right_value)
-                case '-':
-                    value = self.builder.sub(left_value, right_value)
-                case '*':
-                    value = self.builder.mul(left_value, right_value)
-                case '/':
-                    value = self.builder.sdiv(left_value, right_value)
-                case '%':
-                    value = self.builder.srem(left_value, right_value)
-                case '^':
-                    # TODO
-                    pass
-                case '<':
-                    value = self.builder.icmp_signed('<', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '<=':
-                    value = self.builder.icmp_signed('<=', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '>':
-                    value = self.builder.icmp_signed('>', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '>=':
-                    value = self.builder.icmp_signed('>=', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '==':
-                    value = self.builder.icmp_signed('==', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '!=':
-                    value = self.builder.icmp_signed('!=', left_value, right_value)
-                    Type = ir.IntType(1)
-
-        if isinstance(right_type, ir.FloatType) and isinstance(left_type, ir.FloatType):
-            Type = self.type_map['float']
-            match operator:
-                case '+':
-                    value = self.builder.fadd(left_value, right_value)
-                case '-':
-                    value = self.builder.fsub(left_value, right_value)
-                case '*':
-                    value = self.builder.fmul(left_value, right_value)
-                case '/':
-                    value = self.builder.fdiv(left_value, right_value)
-                case '%':
-                    value = self.builder.frem(left_value, right_value)
-                case '^':
-                    # TODO
-                    pass
-                case '<':
-                    value = self.builder.fcmp_ordered('<', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '<=':
-                    value = self.builder.fcmp_ordered('<=', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '>':
-                    value = self.builder.fcmp_ordered('>', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '>=':
-                    value = self.builder.fcmp_ordered('>=', left_value, right_value)
-                    Type = ir.IntType(1)
-                case '==':
-                    value = self.builder.fcmp_ordered('==', left_value, right_value)
-                    Type = ir.IntType(1)   
-                case '!=':
-                    value = self.builder.fcmp_ordered('!=', left_value, right_value)
-                    Type = ir.IntType(1)                
-        return value, Type
-
-    def __visit_call_expression(self, node: CallExpression) -> tuple[ir.Instruction, ir.Type]:
+        code = -1
+        if left_code == right_code and left_code >= 0:
+            b = self.builder
+            op = self._BINOP_TABLES[left_code].get(operator)
+            if op is not None:
+                value = getattr(b, op)(left_value, right_value)
+                Type = left_type
+                code = left_code
+            elif operator in self._COMPARISONS:
+                value = getattr(b, self._CMP_METHODS[left_code])(operator, left_value, right_value)
+                Type = self.bool_t
+                code = self.BOOL_CODE
+        return value, Type, code
+
+    def __visit_call_expression(self, node: CallExpression) -> tuple[ir.Instruction, ir.Type, int]:
         name: str = node.function.value
         params: list[Expression] = node.arguments
 
@@ -275,43 +442,100 @@ class Compiler:
         
         if len(params) > 0:
             for x in params:
-                p_val, p_type = self.__resolve_value(x)
+                p_val, p_type, _ = self.__resolve_value(x)
                 args.append(p_val)
                 types.append(p_type)
 
         match name:
             case _:
-                func, ret_type = self.env.lookup(name)
+                func, ret_type, _ = self.env.lookup(name)
                 ret = self.builder.call(func, args)
 
-        return ret, ret_type
+        return ret, ret_type, self._type_codes.get(ret_type, -1)
 
     # endregion
 
     # endregion
 
     # region Helper Methods
-    def __resolve_value(self, node: Expression, value_type: str = None) -> tuple[ir.Value, ir.Type]:
-        match node.type():
-            case NodeType.IntegerLiteral:
-               node: IntegerLiteral = node
-               value, Type = node.value, self.type_map['int' if value_type is None else value_type]
-               return ir.Constant(Type, value), Type
-            case NodeType.FloatLiteral:
-               node: FloatLiteral = node
-               value, Type = node.value, self.type_map['float' if value_type is None else value_type]
-               return ir.Constant(Type, value), Type
-            case NodeType.IdentifierLiteral:
-               node: IdentifierLiteral = node
-               ptr, Type = self.env.lookup(node.value)
-               return self.builder.load(ptr), Type
-            case NodeType.BooleanLiteral:
-               node: BooleanLiteral = node
-               return ir.Constant(ir.IntType(1), 1 if node.value else 0), ir.IntType(1)
-            # Expression Values
-            case NodeType.InfixExpression:
-                return self.__visit_infix_expression(node)
-            case NodeType.CallExpression:
-                return self.__visit_call_expression(node)            
+    def save_bitcode(self, path: str) -> None:
+        """ Writes the finalized module's bitcode to path so later runs of
+            the same source can skip the whole front end """
+        with open(path, 'wb') as f:
+            f.write(self.finalize().as_bitcode())
+
+    @staticmethod
+    def load_bitcode(path: str) -> llvm.ModuleRef:
+        """ Loads an already optimized module back from cached bitcode """
+        with open(path, 'rb') as f:
+            return llvm.parse_bitcode(f.read())
+
+    def ir_text(self) -> str:
+        """ Serializes the module to textual IR, caching the result so
+            logging and finalize() share a single serialization """
+        if self._ir_text is None:
+            self._ir_text = str(self.module)
+        return self._ir_text
+
+    def finalize(self, level: int = 3) -> llvm.ModuleRef:
+        """ Parses the emitted IR exactly once, verifies it and runs LLVM's
+            module-level optimization passes (mem2reg, instcombine, gvn,
+            simplifycfg, ...) over it. The binding module is cached on
+            self.llvm_module and handed to every downstream consumer.
+
+            The text round-trip here is unavoidable: llvmlite's IR layer only
+            serializes to textual IR, and as_bitcode() exists only on the
+            binding module this parse produces. Repeat runs skip the trip
+            entirely via the bitcode cache. """
+        if self.llvm_module is None:
+            mod: llvm.ModuleRef = llvm.parse_assembly(self.ir_text())
+            mod.verify()
+
+            pmb = llvm.create_pass_manager_builder()
+            pmb.opt_level = level
+            pmb.loop_vectorize = True
+            pmb.slp_vectorize = True
+
+            pm = llvm.create_module_pass_manager()
+            pmb.populate(pm)
+            pm.run(mod)
+
+            self.llvm_module = mod
+
+        return self.llvm_module
+
+    def __resolve_value(self, node: Expression) -> tuple[ir.Value, ir.Type, int]:
+        fn = self._resolve_dispatch.get(node.type)
+        if fn is not None:
+            return fn(node)
+
+    def __resolve_integer_literal(self, node: IntegerLiteral) -> tuple[ir.Value, ir.Type, int]:
+        value: int = node.value
+
+        const = self._int_const_cache.get(value)
+        if const is None:
+            const = ir.Constant(self.int_t, value)
+            self._int_const_cache[value] = const
+
+        return const, self.int_t, self.INT_CODE
+
+    def __resolve_float_literal(self, node: FloatLiteral) -> tuple[ir.Value, ir.Type, int]:
+        value: float = node.value
+
+        const = self._float_const_cache.get(value)
+        if const is None:
+            const = ir.Constant(self.float_t, value)
+            self._float_const_cache[value] = const
+
+        return const, self.float_t, self.FLOAT_CODE
+
+    def __resolve_identifier_literal(self, node: IdentifierLiteral) -> tuple[ir.Value, ir.Type, int]:
+        value, Type, is_ssa = self.env.lookup(node.value)
+        if not is_ssa:
+            value = self.builder.load(value)
+        return value, Type, self._type_codes.get(Type, -1)
+
+    def __resolve_boolean_literal(self, node: BooleanLiteral) -> tuple[ir.Value, ir.Type, int]:
+        return ir.Constant(self.bool_t, 1 if node.value else 0), self.bool_t, self.BOOL_CODE
 
     # endregion
\ No newline at end of file
@@ -1,24 +1,23 @@
 from llvmlite import ir
 
 class Environment:
-    def __init__(self, records: dict[str, tuple[ir.Value, ir.Type]] = None, parent = None, name : str  = "global") -> None:
-       self.records: dict[str, tuple[ir.Value, ir.Type]] = records if records else {}
+    def __init__(self, records: dict[str, tuple[ir.Value, ir.Type, bool]] = None, parent = None, name : str  = "global") -> None:
+       self.records: dict[str, tuple[ir.Value, ir.Type, bool]] = records if records else {}
        self.parent : Environment | None = parent
        self.name : str  = name
 
-    def define(self, name: str, value: ir.Value, __type: ir.Type) -> ir.Value:
-        self.records[name] = (value, __type)
-        return value
+       # Flattened view of everything visible in this scope, so lookup is a
+       # single dict probe instead of a recursive walk up the parent chain
+       self.visible: dict[str, tuple[ir.Value, ir.Type, bool]] = dict(parent.visible) if parent else {}
+       self.visible.update(self.records)
 
-    def lookup(self, name: str) -> tuple[ir.Value, ir.Type]:
-        return self.__resolve(name)
+    def define(self, name: str, value: ir.Value, __type: ir.Type, is_ssa: bool = False) -> ir.Value:
+        # SSA records hold the value itself rather than a stack slot, so
+        # readers skip the load
+        record = (value, __type, is_ssa)
+        self.records[name] = record
+        self.visible[name] = record
+        return value
 
-    def __resolve(self, name: str) -> tuple[ir.Value, ir.Type]:
-        if name in self.records:
-            return self.records[name]
-        elif self.parent:
-            return self.parent.__resolve(name)
-        else:
-            return None
-        
-            
\ No newline at end of file
+    def lookup(self, name: str) -> tuple[ir.Value, ir.Type, bool]:
+        return self.visible.get(name)
@@ -1,15 +1,52 @@
-from Token import Token, TokenType, lookup_ident
+import sys
+
+from Token import Token, TokenType, lookup_ident, match_keyword
 from typing import Any
 
+# Byte values the two-char operator handling compares against
+_MINUS = ord('-')
+_LT = ord('<')
+_GT = ord('>')
+_EQ = ord('=')
+_BANG = ord('!')
+_DOT = ord('.')
+_NEWLINE = ord('\n')
+
+# Single-byte tokens: byte -> (type, literal). The literals are shared
+# one-char strings, so every '+' token reuses the same object
+_SINGLE_TOKENS: dict[int, tuple[TokenType, str]] = {
+    ord('+'): (TokenType.PLUS, '+'),
+    ord('*'): (TokenType.ASTERISK, '*'),
+    ord('/'): (TokenType.SLASH, '/'),
+    ord('^'): (TokenType.POW, '^'),
+    ord('%'): (TokenType.MODULUS, '%'),
+    ord(':'): (TokenType.COLON, ':'),
+    ord(','): (TokenType.COMMA, ','),
+    ord('('): (TokenType.LPAREN, '('),
+    ord(')'): (TokenType.RPAREN, ')'),
+    ord('{'): (TokenType.LBRACE, '{'),
+    ord('}'): (TokenType.RBRACE, '}'),
+    ord(';'): (TokenType.SEMICOLON, ';')
+}
+
+_WHITESPACE = (ord(' '), ord('\t'), _NEWLINE, ord('\r'))
+
 class Lexer:
-    def __init__(self, source: str) -> None:
+    """ Streaming lexer: tokens are produced one at a time as the parser
+        pulls them, so only the current and peek tokens are ever live --
+        the token stream is never materialized as a whole.
+
+        The source is a bytes-like buffer; characters are compared as ints
+        and strings are only built when a literal reaches a token """
+
+    def __init__(self, source: bytes) -> None:
         self.source = source
 
         self.position = -1;
         self.read_position: int = 0
         self.line_no: int = 0
 
-        self.current_char: str | None = None
+        self.current_char: int | None = None
 
         self.__read_char()
 
@@ -22,7 +59,7 @@ class Lexer:
         self.position = self.read_position
         self.read_position += 1
 
-    def __peek_char(self) -> str | None:
+    def __peek_char(self) -> int | None:
         """ Peeks to the upcoming char without advancing the lexer position """
         if self.read_position >= len(self.source):
             return None
@@ -30,137 +67,117 @@ class Lexer:
         return self.source[self.read_position]
 
     def skip_whitespace(self) -> None:
-        while self.current_char in [' ', '\t', '\n', '\r']:
-            if self.current_char == '\n':
+        while self.current_char in _WHITESPACE:
+            if self.current_char == _NEWLINE:
                 self.line_no += 1
-            
+
             self.__read_char()
 
     def __new_token(self, tt: TokenType, literal: Any):
         return Token(type=tt, literal=literal, line_no=self.line_no, position=self.position)
 
-    def __is_digit(self, ch: str) -> bool:
-        return '0' <= ch and ch <= '9'
+    def __is_digit(self, ch: int) -> bool:
+        return 48 <= ch <= 57
 
-    def __is_letter(self, ch: str) -> bool:
-        return 'a' <= ch and ch <= 'z' or 'A' <= ch and ch <= 'Z' or ch == '_'
+    def __is_letter(self, ch: int) -> bool:
+        return 97 <= ch <= 122 or 65 <= ch <= 90 or ch == 95
 
     def __read_number(self) -> Token:
         start_pos: int = self.position
         dot_count: int = 0
 
-        output: str = ""
-        while self.__is_digit(self.current_char) or self.current_char == '.':
-            if self.current_char == '.':
+        while self.current_char is not None and (self.__is_digit(self.current_char) or self.current_char == _DOT):
+            if self.current_char == _DOT:
                 dot_count += 1
-                
+
             if dot_count > 1:
                 print(f"Too many decimals on line {self.line_no}, position {self.position}")
-                return self.__new_token(TokenType.ILLEGAL, self.source[start_pos:self.position])
-
-            output += self.source[self.position]
+                return self.__new_token(TokenType.ILLEGAL, bytes(self.source[start_pos:self.position]).decode())
 
             self.__read_char()
 
-            if self.current_char is None:
-                break
-            
+        literal = bytes(self.source[start_pos:self.position])
         if dot_count == 0:
-            return self.__new_token(TokenType.INT, int(output))
+            return self.__new_token(TokenType.INT, int(literal))
         else:
-            return self.__new_token(TokenType.FLOAT, float(output))
+            return self.__new_token(TokenType.FLOAT, float(literal))
 
     def __read_identifier(self) -> str:
         position = self.position
-        while self.current_char is not None and (self.__is_letter(self.current_char) or self.current_char.isalnum()):
+        while self.current_char is not None and (self.__is_letter(self.current_char) or self.__is_digit(self.current_char)):
             self.__read_char()
-        
-        return self.source[position:self.position]
 
-    def next_token(self) -> None:
+        # Interned so every occurrence of an identifier shares one string
+        # object and symbol-table probes hit dict's identity fast path
+        return sys.intern(bytes(self.source[position:self.position]).decode())
+
+    def next_token(self) -> Token:
         tok: Token = None
 
         self.skip_whitespace()
 
-        match self.current_char:
-            case '+':
-                tok = self.__new_token(TokenType.PLUS, self.current_char)
-            case '-':
-                # Handle the arrow
-                if self.__peek_char:
-                    ch = self.current_char
-                    self.__read_char();
-                    tok = self.__new_token(TokenType.ARROW, ch + self.current_char)
-                else:
-                    tok = self.__new_token(TokenType.MINUS, self.current_char)                   
-
-            case '*':
-                tok = self.__new_token(TokenType.ASTERISK, self.current_char)
-            case '/':
-                tok = self.__new_token(TokenType.SLASH, self.current_char)
-            case '^':
-                tok = self.__new_token(TokenType.POW, self.current_char)
-            case '%':
-                tok = self.__new_token(TokenType.MODULUS, self.current_char)
-            case '<':
-                # Handle <=
-                if self.__peek_char() == '=':
-                    ch = self.current_char
-                    self.__read_char()
-                    tok = self.__new_token(TokenType.LT_EQ, ch + self.current_char)
-                else:
-                    tok = self.__new_token(TokenType.LT, self.current_char)
-            case '>':
-                # Handle >=
-                if self.__peek_char() == '=':
-                    ch = self.current_char
-                    self.__read_char()
-                    tok = self.__new_token(TokenType.GT_EQ, ch + self.current_char)
-                else:
-                    tok = self.__new_token(TokenType.GT, self.current_char) 
-            case '=':
-                # Handle ==
-                if self.__peek_char() == '=':
-                    ch = self.current_char
-                    self.__read_char()
-                    tok = self.__new_token(TokenType.EQ_EQ, ch + self.current_char)
-                else:
-                    tok = self.__new_token(TokenType.EQ, self.current_char) 
-            case '!':
-                # Handle !=
-                if self.__peek_char() == '=':
-                    ch = self.current_char
-                    self.__read_char()
-                    tok = self.__new_token(TokenType.NOT_EQ, ch + self.current_char)
-                else:
-                    # TODO
-                    tok = self.__new_token(TokenType.ILLEGAL, self.current_char) 
-            case ':':
-                tok = self.__new_token(TokenType.COLON, self.current_char)
-            case ',':
-                tok = self.__new_token(TokenType.COMMA, self.current_char)
-            case '(':
-                tok = self.__new_token(TokenType.LPAREN, self.current_char)
-            case ')':
-                tok = self.__new_token(TokenType.RPAREN, self.current_char)
-            case '{':
-                tok = self.__new_token(TokenType.LBRACE, self.current_char)
-            case '}':
-                tok = self.__new_token(TokenType.RBRACE, self.current_char)
-            case ';':
-                tok = self.__new_token(TokenType.SEMICOLON, self.current_char)
-            case None:
-                tok = self.__new_token(TokenType.EOF, "")
-            case _:
-                if self.__is_letter(self.current_char):
-                    literal: str = self.__read_identifier()
-                    tt: TokenType = lookup_ident(literal)
-                    tok = self.__new_token(tt=tt, literal=literal)
-                    return tok
-                elif self.__is_digit(self.current_char):
-                    return  self.__read_number()
-                else:
-                    tok = self.__new_token(TokenType.ILLEGAL, self.current_char)
-        
+        ch = self.current_char
+        if ch is None:
+            tok = self.__new_token(TokenType.EOF, "")
+        elif ch == _MINUS:
+            # Handle the arrow
+            if self.__peek_char() == _GT:
+                self.__read_char()
+                tok = self.__new_token(TokenType.ARROW, '->')
+            else:
+                tok = self.__new_token(TokenType.MINUS, '-')
+        elif ch == _LT:
+            # Handle <=
+            if self.__peek_char() == _EQ:
+                self.__read_char()
+                tok = self.__new_token(TokenType.LT_EQ, '<=')
+            else:
+                tok = self.__new_token(TokenType.LT, '<')
+        elif ch == _GT:
+            # Handle >=
+            if self.__peek_char() == _EQ:
+                self.__read_char()
+                tok = self.__new_token(TokenType.GT_EQ, '>=')
+            else:
+                tok = self.__new_token(TokenType.GT, '>')
+        elif ch == _EQ:
+            # Handle ==
+            if self.__peek_char() == _EQ:
+                self.__read_char()
+                tok = self.__new_token(TokenType.EQ_EQ, '==')
+            else:
+                tok = self.__new_token(TokenType.EQ, '=')
+        elif ch == _BANG:
+            # Handle !=
+            if self.__peek_char() == _EQ:
+                self.__read_char()
+                tok = self.__new_token(TokenType.NOT_EQ, '!=')
+            else:
+                tok = self.__new_token(TokenType.ILLEGAL, chr(ch))
+        else:
+            spec = _SINGLE_TOKENS.get(ch)
+            if spec is not None:
+                tok = self.__new_token(spec[0], spec[1])
+            elif self.__is_letter(ch):
+                # Fast path: walk the keyword trie over the buffer; only
+                # take the match if it ends on a word boundary
+                tt, length = match_keyword(self.source, self.position)
+                if tt is not None:
+                    end = self.position + length
+                    after = self.source[end] if end < len(self.source) else None
+                    if after is None or not (self.__is_letter(after) or self.__is_digit(after)):
+                        literal = sys.intern(bytes(self.source[self.position:end]).decode())
+                        for _ in range(length):
+                            self.__read_char()
+                        return self.__new_token(tt=tt, literal=literal)
+
+                literal: str = self.__read_identifier()
+                tt: TokenType = lookup_ident(literal)
+                return self.__new_token(tt=tt, literal=literal)
+            elif self.__is_digit(ch):
+                return self.__read_number()
+            else:
+                tok = self.__new_token(TokenType.ILLEGAL, chr(ch))
+
         self.__read_char()
-        return tok
\ No newline at end of file
+        return tok
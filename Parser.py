@@ -21,14 +21,14 @@ class PrecedenceType(Enum):
     P_CALL = auto()
     P_INDEX = auto()
 
-# Precedence Mapping
+# Precedence Mapping, ordered hottest-first
 PRECEDENCES: dict[TokenType, PrecedenceType] = {
     TokenType.PLUS: PrecedenceType.P_SUM,
     TokenType.MINUS: PrecedenceType.P_SUM,
-    TokenType.SLASH: PrecedenceType.P_PRODUCT,
     TokenType.ASTERISK: PrecedenceType.P_PRODUCT, 
+    TokenType.SLASH: PrecedenceType.P_PRODUCT,
     TokenType.MODULUS: PrecedenceType.P_PRODUCT,
-    TokenType.POW: PrecedenceType.P_EXPONENT,
+    TokenType.LPAREN: PrecedenceType.P_CALL,
 
     TokenType.EQ_EQ: PrecedenceType.P_EQUALS,
     TokenType.NOT_EQ: PrecedenceType.P_EQUALS,
@@ -36,14 +36,20 @@ PRECEDENCES: dict[TokenType, PrecedenceType] = {
     TokenType.GT: PrecedenceType.P_LESSGREATER,
     TokenType.LT_EQ: PrecedenceType.P_LESSGREATER,
     TokenType.GT_EQ: PrecedenceType.P_LESSGREATER,
-    TokenType.LPAREN: PrecedenceType.P_CALL
+    TokenType.POW: PrecedenceType.P_EXPONENT
 }
 
 class Parser:
     def __init__(self, lexer: Lexer) -> None:
         self.lexer = lexer
+        # The parser is fused to the lexer through this bound method: each
+        # advance is a single call with no attribute hop, and no token list
+        # ever materializes between the two
+        self._next_lexer_token = lexer.next_token
 
         self.errors: list[str] = []
+        # Cheap happy-path check; flipped on the first recorded error
+        self.has_errors: bool = False
         
         self.current_token : Token = None
         self.peek_token : Token = None
@@ -61,17 +67,25 @@ class Parser:
         self.infix_parse_fns: dict[TokenType, Callable] = {
             TokenType.PLUS : self.__parse_infix_expression,
             TokenType.MINUS : self.__parse_infix_expression,
-            TokenType.SLASH : self.__parse_infix_expression,
             TokenType.ASTERISK : self.__parse_infix_expression,
-            TokenType.POW : self.__parse_infix_expression,
+            TokenType.SLASH : self.__parse_infix_expression,
             TokenType.MODULUS : self.__parse_infix_expression,
+            TokenType.LPAREN : self.__parse_call_expression,
             TokenType.EQ_EQ : self.__parse_infix_expression,
             TokenType.NOT_EQ : self.__parse_infix_expression,
             TokenType.LT : self.__parse_infix_expression,
             TokenType.GT : self.__parse_infix_expression,
             TokenType.LT_EQ : self.__parse_infix_expression,
             TokenType.GT_EQ : self.__parse_infix_expression,
-            TokenType.LPAREN : self.__parse_call_expression
+            TokenType.POW : self.__parse_infix_expression
+        }
+
+        # Statement dispatch, keyed once; expression statements are the
+        # fall-through default
+        self.stmt_parse_fns: dict[TokenType, Callable] = {
+            TokenType.LET : self.__parse_let_statement,
+            TokenType.FN : self.__parse_function_statement,
+            TokenType.RETURN : self.__parse_return_statement
         }
 
         self.__next_token()
@@ -80,7 +94,7 @@ class Parser:
     # region Parser Helpers
     def __next_token(self) -> None:
         self.current_token = self.peek_token
-        self.peek_token = self.lexer.next_token()
+        self.peek_token = self._next_lexer_token()
 
     def __current_token_is(self, tt: TokenType) -> bool:
         return self.current_token.type == tt
@@ -97,32 +111,35 @@ class Parser:
             return False
     
     def __current_precedence(self) -> PrecedenceType:
-        prec: int | None = PRECEDENCES.get(self.current_token.type)
+        prec: PrecedenceType | None = PRECEDENCES.get(self.current_token.type)
         if prec is None:
             return PrecedenceType.P_LOWEST
         return prec
 
     def __peek_precedence(self) -> PrecedenceType:
-        prec: int | None = PRECEDENCES.get(self.peek_token.type)
+        prec: PrecedenceType | None = PRECEDENCES.get(self.peek_token.type)
         if prec is None:
             return PrecedenceType.P_LOWEST
         return prec
 
     def __peek_error(self, tt: TokenType):
+        self.has_errors = True
         self.errors.append(f"Expected next token to be {tt}, got {self.peek_token.type} instead.")
 
     def __no_prefix_parse_fn_error(self, tt: TokenType):
+        self.has_errors = True
         self.errors.append(f"No Prefix Parser Function for {tt} found.")
 
     # endregion
     
     def parse_program(self) -> None:
         program: Program = Program()
+        append = program.statements.append
 
         while self.current_token.type != TokenType.EOF:
             stmt: Statement = self.__parse_statement()
             if stmt is not None:
-                program.statements.append(stmt)
+                append(stmt)
             
             self.__next_token()
 
@@ -133,15 +150,7 @@ class Parser:
         if self.current_token.type == TokenType.IDENT and self.__peek_token_is(TokenType.EQ):
             return self.__parse_assignment_statement()
 
-        match self.current_token.type:
-            case TokenType.LET:
-                return self.__parse_let_statement()
-            case TokenType.FN:
-                return self.__parse_function_statement()
-            case TokenType.RETURN:
-                return self.__parse_return_statement()
-            case _:
-                return self.__parse_expression_statement()
+        return self.stmt_parse_fns.get(self.current_token.type, self.__parse_expression_statement)()
 
     def __parse_expression_statement(self) -> ExpressionStatement:
         expr = self.__parse_expression(PrecedenceType.P_LOWEST)
@@ -260,13 +269,14 @@ class Parser:
     
     def __parse_block_statement(self) -> BlockStatement:
         block_stmt: BlockStatement = BlockStatement()
+        append = block_stmt.statements.append
 
         self.__next_token()
 
         while not self.__current_token_is(TokenType.RBRACE) and not self.__current_token_is(TokenType.EOF):
             stmt: Statement = self.__parse_statement()
             if stmt is not None:
-                block_stmt.statements.append(stmt)
+                append(stmt)
             
             self.__next_token()
         
@@ -321,8 +331,9 @@ class Parser:
         
         left_expr: Expr = prefix_fn()
 
+        infix_fns = self.infix_parse_fns
         while not self.__peek_token_is(TokenType.SEMICOLON) and precedence.value < self.__peek_precedence().value:
-            infix_fn: Callable | None = self.infix_parse_fns.get(self.peek_token.type)
+            infix_fn: Callable | None = infix_fns.get(self.peek_token.type)
             if infix_fn is None:
                 return left_expr
             
@@ -391,6 +402,7 @@ class Parser:
         try:
            int_lit.value = int(self.current_token.literal)
         except:
+            self.has_errors = True
             self.errors.append(f"Could not parse '{self.current_token.literal} as an integer.")
             return None;
 
@@ -402,6 +414,7 @@ class Parser:
         try:
            float_lit.value = float(self.current_token.literal)
         except:
+            self.has_errors = True
             self.errors.append(f"Could not parse '{self.current_token.literal}' as a float.")
             return None;
 
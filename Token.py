@@ -1,58 +1,67 @@
-from enum import Enum
+from enum import Enum, IntEnum, auto
 from typing import Any
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+   # Members compare and hash as native ints on the lexer/parser hot paths;
+   # keep Enum's __str__ so debug output still shows the member name
+   __str__ = Enum.__str__
+   __format__ = Enum.__format__
+
    # Special Items
-   EOF = "EOF"
-   ILLEGAL  = "ILLEGAL"
+   EOF = auto()
+   ILLEGAL  = auto()
 
    # Data Types
-   IDENT = "IDENT"
-   INT = "INT"
-   FLOAT = "FLOAT"
+   IDENT = auto()
+   INT = auto()
+   FLOAT = auto()
 
    # Arithmetic Symbols
-   PLUS = "PLUS"
-   MINUS = "MINUS"
-   ASTERISK = "ASTERISK"
-   SLASH = "SLASH"
-   POW = "POW"
-   MODULUS = "MODULUS"
+   PLUS = auto()
+   MINUS = auto()
+   ASTERISK = auto()
+   SLASH = auto()
+   POW = auto()
+   MODULUS = auto()
 
    # Assignment
-   EQ = "EQ"
+   EQ = auto()
 
    # Comparison Symbols
-   LT = '<'
-   GT = '>'
-   EQ_EQ = '=='
-   NOT_EQ = '!='
-   LT_EQ = '<='
-   GT_EQ = '>='
+   LT = auto()
+   GT = auto()
+   EQ_EQ = auto()
+   NOT_EQ = auto()
+   LT_EQ = auto()
+   GT_EQ = auto()
 
    # Symbols
-   COLON = "COLON"
-   COMMA = "COMMA"
-   SEMICOLON = "SEMICOLON"
-   ARROW = "ARROW"
-   LPAREN = "LPAREN"
-   RPAREN = "RPAREN"
-   LBRACE = "LBRACE"
-   RBRACE = "RBRACE"
+   COLON = auto()
+   COMMA = auto()
+   SEMICOLON = auto()
+   ARROW = auto()
+   LPAREN = auto()
+   RPAREN = auto()
+   LBRACE = auto()
+   RBRACE = auto()
 
    # Keywords
-   LET = "LET"
-   FN = "FN"
-   RETURN = "RETURN"
-   IF = "IF"
-   ELSE = "ELSE"
-   TRUE = "TRUE"
-   FALSE = "FALSE"
+   LET = auto()
+   FN = auto()
+   RETURN = auto()
+   IF = auto()
+   ELSE = auto()
+   TRUE = auto()
+   FALSE = auto()
 
    # Types
-   TYPE = "TYPE"
+   TYPE = auto()
 
 class Token:
+    # Four fixed attributes per token; slots keep instances to a few dozen
+    # bytes instead of a per-instance __dict__
+    __slots__ = ("type", "literal", "line_no", "position")
+
     def __init__(self, type : TokenType, literal: Any, line_no: int, position: int) -> None:
         self.type = type
         self.literal = literal
@@ -60,7 +69,7 @@ class Token:
         self.position = position
 
     def __str__(self) -> str:
-        return f"Token[{self.type} : {self.literal} : Line {self.line_no} : Positionn {self.position}]"
+        return f"Token[{self.type} : {self.literal} : Line {self.line_no} : Position {self.position}]"
 
     def __repr__(self) -> str:
         return str(self)
@@ -86,18 +95,56 @@ ALT_KEYWORDS: dict[str, TokenType] = {
     "imposter": TokenType.ELSE
 }
 
-TYPE_KEYWORDS: list[str] = ["int", "float"]
+TYPE_KEYWORDS: frozenset[str] = frozenset(("int", "float"))
+
+# All three keyword tables merged once at import time, so classifying an
+# identifier is a single dict probe instead of three
+_IDENT_LOOKUP: dict[str, TokenType] = {
+    **KEYWORDS,
+    **ALT_KEYWORDS,
+    **{k: TokenType.TYPE for k in TYPE_KEYWORDS}
+}
 
 def lookup_ident(ident: str) -> TokenType:
-    tt: TokenType | None = KEYWORDS.get(ident)
-    if tt is not None:
-        return tt
-    
-    tt: TokenType | None = ALT_KEYWORDS.get(ident)
-    if tt is not None:
-        return tt
-    
-    if ident in TYPE_KEYWORDS:
-        return TokenType.TYPE
-    
-    return TokenType.IDENT
+    return _IDENT_LOOKUP.get(ident, TokenType.IDENT)
+
+
+def _build_keyword_trie() -> dict:
+    trie: dict = {}
+    for word, tt in _IDENT_LOOKUP.items():
+        node = trie
+        for b in word.encode():
+            node = node.setdefault(b, {})
+        node[-1] = tt  # terminal marker; -1 cannot collide with a byte key
+    return trie
+
+# Byte trie over every keyword, walked directly against the source buffer so
+# keywords classify without slicing a throwaway string first
+_KEYWORD_TRIE: dict = _build_keyword_trie()
+
+
+def match_keyword(source, start: int) -> tuple[TokenType | None, int]:
+    """ Walks the keyword trie over source from start. Returns
+        (token_type, length) for the longest keyword match, or (None, 0)
+        when no keyword starts here. The caller still has to check that the
+        match ends on a word boundary """
+    node = _KEYWORD_TRIE
+    i = start
+    n = len(source)
+
+    tt: TokenType | None = None
+    length: int = 0
+    while i < n:
+        nxt = node.get(source[i])
+        if nxt is None:
+            break
+
+        node = nxt
+        i += 1
+
+        end_tt = node.get(-1)
+        if end_tt is not None:
+            tt = end_tt
+            length = i - start
+
+    return tt, length
@@ -2,10 +2,20 @@ from Lexer import Lexer
 from Parser import Parser
 from Compiler import Compiler
 from AST import Program
+import hashlib
 import json
+import mmap
+import os
+import sys
 import time
 
-from llvmlite import ir
+# orjson serializes large ASTs an order of magnitude faster than the stdlib;
+# fall back to json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import llvmlite.binding as llvm
 from ctypes import CFUNCTYPE, c_int, c_float
 
@@ -14,67 +24,147 @@ PARSER_DEBUG: bool = True
 COMPILER_DEBUG: bool = True
 RUN_CODE: bool = True
 
-if __name__ == '__main__':
-    with open("tests/test.lime", "r") as f:
-        code: str = f.read()
-    
-    if LEXER_DEBUG:
-        debug_lex: Lexer = Lexer(source=code)
+# opt=0 selects FastISel-style codegen for quick cold starts; leave False so
+# compute-bound programs get the full opt=3 pipeline
+FAST_STARTUP: bool = False
 
-        while debug_lex.current_char is not None:
-            print(debug_lex.next_token())
+CACHE_DIR: str = os.path.expanduser("~/.cache/lime")
+
+
+_LLVM_READY: bool = False
+_TARGET_MACHINE: llvm.TargetMachine | None = None
+
+
+def initialize_llvm() -> llvm.TargetMachine:
+    """ One-time LLVM initialization. The target machine is created once and
+        reused, so repeated compiles in the same process (REPL or watch
+        workflows) skip the setup cost """
+    global _LLVM_READY, _TARGET_MACHINE
+
+    if not _LLVM_READY:
+        llvm.initialize()
+        llvm.initialize_native_target()
+        llvm.initialize_native_asmprinter()
+
+        _TARGET_MACHINE = llvm.Target.from_default_triple().create_target_machine(
+            opt=0 if FAST_STARTUP else 3, codemodel='jitdefault')
+        _LLVM_READY = True
+
+    return _TARGET_MACHINE
+
+
+def cache_path(code: bytes | memoryview, suffix: str) -> str:
+    """ Cache file path for this source, keyed by its hash """
+    key: str = hashlib.sha256(code).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}{suffix}")
+
+
+def compile_program(code: bytes | memoryview) -> llvm.ModuleRef:
+    """ Compiles source to an optimized LLVM module. Results are cached on
+        disk keyed by the source hash, so re-running an unchanged program
+        skips the lexer, parser and compiler entirely """
+    bc_path: str = cache_path(code, ".bc")
+
+    if os.path.exists(bc_path):
+        return Compiler.load_bitcode(bc_path)
 
     l: Lexer = Lexer(source=code)
     p: Parser = Parser(lexer=l)
     program: Program = p.parse_program()
-    
-    if len(p.errors) > 0:
+
+    if p.has_errors:
         for err in p.errors:
             print(err)
         exit(1)
 
+    if PARSER_DEBUG or COMPILER_DEBUG:
+        os.makedirs("debug", exist_ok=True)
+
     if PARSER_DEBUG:
         print("==== PARSER DEBUG ====")
-        with open("debug/ast.json", "w") as f:
-           json.dump(program.json(), f, indent=4)
+        if orjson is not None:
+            with open("debug/ast.json", "wb") as f:
+                f.write(orjson.dumps(program.json(), option=orjson.OPT_INDENT_2))
+        else:
+            with open("debug/ast.json", "w") as f:
+                json.dump(program.json(), f, indent=4)
 
         print("Successful!")
-        
+
     c: Compiler = Compiler()
     c.compile(node=program)
 
-    # Output steps
-    module: ir.Module = c.module
-    module.triple = llvm.get_default_triple()
+    c.module.triple = llvm.get_default_triple()
 
     if COMPILER_DEBUG:
         with open("debug/ir.ll", "w") as f:
-            f.write(str(module))
+            f.write(c.ir_text())
 
-    if RUN_CODE:
-        llvm.initialize()
-        llvm.initialize_native_target()
-        llvm.initialize_native_asmprinter()
+    module_ref: llvm.ModuleRef = c.finalize()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    c.save_bitcode(bc_path)
+
+    return module_ref
+
+if __name__ == '__main__':
+    # Map the source instead of copying it into a Python object; the OS
+    # pages it in lazily and every pass over the file shares the same pages
+    with open("tests/test.lime", "rb") as f:
+        code: memoryview = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    
+    if LEXER_DEBUG:
+        debug_lex: Lexer = Lexer(source=code)
+
+        # Batch the token dump into one write instead of a syscall per token
+        lines: list[str] = []
+        append = lines.append
+        while debug_lex.current_char is not None:
+            append(str(debug_lex.next_token()))
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    # A cached object file lets the run skip compilation *and* codegen.
+    # The codegen level is part of the name so flipping FAST_STARTUP never
+    # serves machine code built at the other level
+    obj_path: str = cache_path(code, f".opt{0 if FAST_STARTUP else 3}.o")
+    obj_hit: bool = RUN_CODE and os.path.exists(obj_path)
 
+    if not obj_hit:
         try:
-            llvm_ir_parsed = llvm.parse_assembly(str(module))
-            llvm_ir_parsed.verify()
+            llvm_ir_parsed = compile_program(code)
         except Exception as e:
             print(e)
             raise
-        
-        target_machine = llvm.Target.from_default_triple().create_target_machine()
 
-        engine = llvm.create_mcjit_compiler(llvm_ir_parsed, target_machine)
+    if RUN_CODE:
+        target_machine = initialize_llvm()
+
+        if obj_hit:
+            # JIT an empty module and link the cached machine code into it
+            engine = llvm.create_mcjit_compiler(llvm.parse_assembly(""), target_machine)
+            with open(obj_path, "rb") as f:
+                engine.add_object_file(llvm.ObjectFileRef.from_data(f.read()))
+        else:
+            engine = llvm.create_mcjit_compiler(llvm_ir_parsed, target_machine)
+
+            def save_object(module, buffer) -> None:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(obj_path, "wb") as f:
+                    f.write(buffer)
+
+            # Capture the object file MCJIT emits so the next run can reload it
+            engine.set_object_cache(notify_func=save_object)
+
         engine.finalize_object()
 
         entry = engine.get_function_address('main')
         cfunc = CFUNCTYPE(c_int)(entry)
 
-        st = time.time()
+        st = time.perf_counter_ns()
 
         result = cfunc()
 
-        et = time.time()
+        et = time.perf_counter_ns()
 
-        print(f'\n\nProgram returned: {result}\n=== Executed in {round((et - st) * 1000, 6)} ms. ===')
\ No newline at end of file
+        print(f'\n\nProgram returned: {result}\n=== Executed in {(et - st) / 1e6:.6f} ms. ===')
\ No newline at end of file